@@ -6,16 +6,127 @@ Provides comprehensive validation for Europass CV YAML files using JSONSchema
 with field suggestions and detailed error reporting.
 """
 
+import functools
+import hashlib
+import math
+import os
+import orjson
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Set, Optional
-from datetime import date, datetime
-from fuzzywuzzy import fuzz, process
+from typing import Dict, Any, List, Set, Optional, Tuple, FrozenSet
+from datetime import date
+from rapidfuzz import fuzz, process, utils
 import jsonschema
-from jsonschema import validate, ValidationError, draft7_format_checker
+from jsonschema import ValidationError, SchemaError, draft7_format_checker
 
 from validation_result import ValidationResult, ValidationMessage, ValidationLevel
 
+# Prefer the libyaml-backed C loader when PyYAML was built with it.
+# YAML files are opened in binary mode so the parser decodes UTF-8 itself.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Default schema path relative to this script
+DEFAULT_SCHEMA_PATH = Path(__file__).parent.parent / "template" / "cv_validation_schema.yml"
+
+# Maximum number of validation results remembered per validator
+RESULT_CACHE_SIZE = 32
+
+# Minimum number of distinct unknown field names before suggestions are scored in one batch
+BATCH_SUGGESTION_MIN = 4
+
+# Maximum number of field-name suggestions remembered per validator
+SUGGESTION_CACHE_SIZE = 256
+
+
+def _is_string_or_date(checker: Any, instance: Any) -> bool:
+    """Treat YAML date/datetime values as strings, as they are written in the CV."""
+    return isinstance(instance, (str, date))
+
+
+def _with_dates_as_strings(keyword_validator: Any) -> Any:
+    """Wrap a string keyword validator so date values are checked as 'YYYY-MM-DD'."""
+    def validate_keyword(validator, value, instance, schema):
+        if isinstance(instance, date):
+            instance = instance.strftime('%Y-%m-%d')
+        return keyword_validator(validator, value, instance, schema)
+    return validate_keyword
+
+
+# Draft 7 validator that accepts dates in place, instead of copying the data to stringify them
+CVSchemaValidator = jsonschema.validators.extend(
+    jsonschema.Draft7Validator,
+    validators={
+        keyword: _with_dates_as_strings(jsonschema.Draft7Validator.VALIDATORS[keyword])
+        for keyword in ("minLength", "maxLength", "pattern", "format", "enum", "const")
+    },
+    type_checker=jsonschema.Draft7Validator.TYPE_CHECKER.redefine("string", _is_string_or_date),
+)
+
+
+def _contains_non_finite_float(data: Any) -> bool:
+    """Check whether nested CV data holds a NaN or infinite float anywhere."""
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, float):
+            if not math.isfinite(obj):
+                return True
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+    return False
+
+
+def _fmt_required(error: ValidationError) -> str:
+    missing_field = error.message.split("'")[1] if "'" in error.message else "field"
+    return f"Required field '{missing_field}' is missing"
+
+
+def _fmt_type(error: ValidationError) -> str:
+    # YAML dates are validated in place; report them as the string they used to be
+    got = 'str' if isinstance(error.instance, date) else type(error.instance).__name__
+    return f"Expected {error.validator_value}, got {got}"
+
+
+def _fmt_format(error: ValidationError) -> str:
+    return f"Invalid format: {error.message}"
+
+
+def _fmt_pattern(error: ValidationError) -> str:
+    return "Value doesn't match required pattern"
+
+
+def _fmt_enum(error: ValidationError) -> str:
+    allowed_values = ", ".join(f"'{v}'" for v in error.validator_value)
+    return f"Value must be one of: {allowed_values}"
+
+
+def _fmt_length(error: ValidationError) -> str:
+    return f"String length validation failed: {error.message}"
+
+
+def _fmt_array_size(error: ValidationError) -> str:
+    return f"Array size validation failed: {error.message}"
+
+
+# Friendlier messages per JSONSchema keyword; other keywords keep jsonschema's message
+_ERROR_FORMATTERS = {
+    "required": _fmt_required,
+    "type": _fmt_type,
+    "format": _fmt_format,
+    "pattern": _fmt_pattern,
+    "enum": _fmt_enum,
+    "minLength": _fmt_length,
+    "maxLength": _fmt_length,
+    "minItems": _fmt_array_size,
+    "maxItems": _fmt_array_size,
+}
+
 
 class CVValidator:
     """Validates CV YAML data against schema with field suggestions."""
@@ -23,140 +134,166 @@ class CVValidator:
     def __init__(self, schema_path: Optional[Path] = None):
         """Initialize validator with schema."""
         if schema_path is None:
-            # Default schema path relative to this script
-            schema_path = Path(__file__).parent.parent / "template" / "cv_validation_schema.yml"
+            schema_path = DEFAULT_SCHEMA_PATH
         
         self.schema_path = schema_path
         self.schema = self._load_schema()
-        self.known_fields = self._extract_known_fields()
+        self._validator = self._build_validator()
+        self.known_fields, self._allowed_at = self._index_schema()
+        # Sorted, indexable copy for fuzzy matching (deterministic tie-breaking)
+        self.known_fields_tuple = tuple(sorted(self.known_fields))
+        # Matching form of each known field ('date_of_birth' -> 'date of birth'), computed once
+        self._match_choices = tuple(utils.default_process(f) for f in self.known_fields_tuple)
+        self._cached_match = functools.lru_cache(maxsize=SUGGESTION_CACHE_SIZE)(self._match_field_name)
+        # Cached outcomes are stored as immutable parts: (is_valid, messages, unknown_fields)
+        self._result_cache: Dict[bytes, Tuple[bool, Tuple[ValidationMessage, ...], Tuple[str, ...]]] = {}
     
     def _load_schema(self) -> Dict[str, Any]:
         """Load JSONSchema from YAML file."""
         try:
-            with open(self.schema_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            with open(self.schema_path, 'rb') as f:
+                return yaml.load(f, Loader=SafeLoader)
         except FileNotFoundError:
             raise FileNotFoundError(f"Schema file not found: {self.schema_path}")
         except yaml.YAMLError as e:
             raise ValueError(f"Error parsing schema YAML: {e}")
     
-    def _normalize_data_for_validation(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize data types for validation (e.g., convert date objects to strings)."""
-        def normalize_recursive(obj: Any) -> Any:
-            if isinstance(obj, dict):
-                return {key: normalize_recursive(value) for key, value in obj.items()}
-            elif isinstance(obj, list):
-                return [normalize_recursive(item) for item in obj]
-            elif isinstance(obj, (date, datetime)):
-                return obj.strftime('%Y-%m-%d')
-            else:
-                return obj
-        
-        return normalize_recursive(data)
+    def _build_validator(self) -> jsonschema.Draft7Validator:
+        """Check the schema once and compile a reusable validator for it."""
+        try:
+            CVSchemaValidator.check_schema(self.schema)
+        except SchemaError as e:
+            raise ValueError(f"Invalid validation schema: {e.message}")
+        return CVSchemaValidator(self.schema, format_checker=draft7_format_checker)
     
-    def _extract_known_fields(self) -> Set[str]:
-        """Extract all valid field names from schema for suggestion matching."""
+    def _index_schema(self) -> Tuple[Set[str], Dict[int, Tuple[FrozenSet[str], Dict[str, Any]]]]:
+        """Collect known field names and per-node allowed fields in a single schema walk.
+        
+        Returns the set of simple and dotted field names used for suggestions, and a
+        map from each schema node with 'properties' (by id) to its allowed field names.
+        """
         fields = set()
+        allowed_at = {}
+        # Boolean schemas (allowed by Draft 7) define no fields
+        stack = [(self.schema, "")] if isinstance(self.schema, dict) else []
         
-        def extract_fields_recursive(obj: Dict[str, Any], prefix: str = "") -> None:
-            if isinstance(obj, dict):
-                if 'properties' in obj:
-                    for field_name, field_def in obj['properties'].items():
-                        full_name = f"{prefix}.{field_name}" if prefix else field_name
-                        fields.add(field_name)  # Add simple name
-                        fields.add(full_name)   # Add full path
-                        
-                        if isinstance(field_def, dict):
-                            extract_fields_recursive(field_def, full_name)
-                
-                if 'items' in obj and isinstance(obj['items'], dict):
-                    extract_fields_recursive(obj['items'], prefix)
-                
-                for key, value in obj.items():
-                    if isinstance(value, dict) and key not in ['properties', 'items']:
-                        extract_fields_recursive(value, prefix)
+        while stack:
+            obj, prefix = stack.pop()
+            
+            properties = obj.get('properties')
+            if isinstance(properties, dict):
+                allowed_at[id(obj)] = (frozenset(properties.keys()), properties)
+                for field_name, field_def in properties.items():
+                    full_name = f"{prefix}.{field_name}" if prefix else field_name
+                    fields.add(field_name)  # Add simple name
+                    fields.add(full_name)   # Add full path
+                    
+                    if isinstance(field_def, dict):
+                        stack.append((field_def, full_name))
+            
+            items = obj.get('items')
+            if isinstance(items, dict):
+                stack.append((items, prefix))
         
-        extract_fields_recursive(self.schema)
-        return fields
+        return fields, allowed_at
     
     def _find_unknown_fields(self, data: Dict[str, Any], schema_props: Dict[str, Any], 
                            path: str = "") -> List[str]:
-        """Recursively find fields not defined in schema."""
+        """Find fields not defined in schema, walking the data with an explicit stack."""
         unknown_fields = []
+        stack = [(data, schema_props, path)]
         
-        if not isinstance(data, dict) or 'properties' not in schema_props:
-            return unknown_fields
-        
-        allowed_fields = set(schema_props['properties'].keys())
-        actual_fields = set(data.keys())
-        
-        # Check for unknown fields at this level
-        for field in actual_fields - allowed_fields:
-            field_path = f"{path}.{field}" if path else field
-            unknown_fields.append(field_path)
-        
-        # Recursively check nested objects
-        for field_name, field_value in data.items():
-            if field_name in allowed_fields:
-                field_path = f"{path}.{field_name}" if path else field_name
-                field_schema = schema_props['properties'][field_name]
+        while stack:
+            node, node_schema, node_path = stack.pop()
+            
+            # Nothing to check for empty objects
+            if not isinstance(node, dict) or not node:
+                continue
+            
+            precomputed = self._allowed_at.get(id(node_schema))
+            if precomputed is not None:
+                allowed_fields, properties = precomputed
+            elif 'properties' in node_schema:
+                # Schema fragment not taken from self.schema
+                properties = node_schema['properties']
+                allowed_fields = frozenset(properties.keys())
+            else:
+                continue
+            
+            # Report unknown fields at this level and queue nested objects,
+            # in document order once popped
+            children = []
+            for field_name, field_value in node.items():
+                field_path = f"{node_path}.{field_name}" if node_path else str(field_name)
+                
+                if field_name not in allowed_fields:
+                    unknown_fields.append(field_path)
+                    continue
                 
+                field_schema = properties[field_name]
                 if isinstance(field_value, dict) and 'properties' in field_schema:
                     # Nested object
-                    unknown_fields.extend(
-                        self._find_unknown_fields(field_value, field_schema, field_path)
-                    )
+                    children.append((field_value, field_schema, field_path))
                 elif isinstance(field_value, list) and 'items' in field_schema:
                     # Array of objects
                     items_schema = field_schema['items']
                     if isinstance(items_schema, dict) and 'properties' in items_schema:
                         for i, item in enumerate(field_value):
                             if isinstance(item, dict):
-                                item_path = f"{field_path}[{i}]"
-                                unknown_fields.extend(
-                                    self._find_unknown_fields(item, items_schema, item_path)
-                                )
+                                children.append((item, items_schema, f"{field_path}[{i}]"))
+            
+            stack.extend(reversed(children))
         
         return unknown_fields
     
+    def _match_field_name(self, field_name: str, threshold: int) -> Optional[str]:
+        """Find the known field most similar to a bare field name."""
+        # token_sort_ratio tolerates reordered words (e.g. 'birth_date' -> 'date_of_birth'),
+        # without scoring a subset of a longer dotted path as a perfect match
+        match = process.extractOne(
+            utils.default_process(field_name), self._match_choices,
+            scorer=fuzz.token_sort_ratio, processor=None, score_cutoff=threshold
+        )
+        
+        if match:
+            return self.known_fields_tuple[match[2]]
+        return None
+    
     def _suggest_field_name(self, unknown_field: str, threshold: int = 60) -> Optional[str]:
         """Suggest a similar field name using fuzzy matching."""
         # Extract just the field name (last part after dot)
-        field_name = unknown_field.split('.')[-1]
+        field_name = unknown_field.rpartition('.')[2]
+        return self._cached_match(field_name, threshold)
+    
+    def _suggest_field_names(self, unknown_fields: List[str],
+                             threshold: int = 60) -> List[Optional[str]]:
+        """Suggest similar field names for several unknown fields at once."""
+        field_names = [unknown_field.rpartition('.')[2] for unknown_field in unknown_fields]
+        queries = list(dict.fromkeys(field_names))
         
-        # Find the best match
-        match = process.extractOne(field_name, self.known_fields, scorer=fuzz.ratio)
+        if len(queries) < BATCH_SUGGESTION_MIN:
+            suggestions = {name: self._cached_match(name, threshold) for name in queries}
+        else:
+            # Score every query against every known field in a single RapidFuzz call
+            scores = process.cdist(
+                [utils.default_process(name) for name in queries], self._match_choices,
+                scorer=fuzz.token_sort_ratio, processor=None, score_cutoff=threshold, workers=-1
+            )
+            suggestions = {}
+            for name, row in zip(queries, scores):
+                best = int(row.argmax())
+                suggestions[name] = self.known_fields_tuple[best] if row[best] >= threshold else None
         
-        if match and match[1] >= threshold:
-            return match[0]
-        return None
+        return [suggestions[name] for name in field_names]
     
     def _format_jsonschema_error(self, error: ValidationError) -> ValidationMessage:
         """Convert JSONSchema ValidationError to ValidationMessage."""
         # Format the field path
-        field_path = ""
-        if error.absolute_path:
-            field_path = ".".join(str(p) for p in error.absolute_path)
+        field_path = ".".join(map(str, error.absolute_path))
         
         # Clean up the error message
-        message = error.message
-        if error.validator == "required":
-            missing_field = error.message.split("'")[1] if "'" in error.message else "field"
-            message = f"Required field '{missing_field}' is missing"
-        elif error.validator == "type":
-            expected_type = error.validator_value
-            message = f"Expected {expected_type}, got {type(error.instance).__name__}"
-        elif error.validator == "format":
-            message = f"Invalid format: {error.message}"
-        elif error.validator == "pattern":
-            message = f"Value doesn't match required pattern"
-        elif error.validator == "enum":
-            allowed_values = ", ".join(f"'{v}'" for v in error.validator_value)
-            message = f"Value must be one of: {allowed_values}"
-        elif error.validator in ["minLength", "maxLength"]:
-            message = f"String length validation failed: {error.message}"
-        elif error.validator in ["minItems", "maxItems"]:
-            message = f"Array size validation failed: {error.message}"
+        formatter = _ERROR_FORMATTERS.get(error.validator)
+        message = formatter(error) if formatter else error.message
         
         return ValidationMessage(
             level=ValidationLevel.ERROR,
@@ -166,46 +303,68 @@ class CVValidator:
     
     def validate_cv_data(self, cv_data: Dict[str, Any]) -> ValidationResult:
         """Validate CV data and return detailed results."""
-        messages = []
+        # Perform JSONSchema validation, collecting all errors in a single pass
+        # (date values are accepted as strings by CVSchemaValidator)
+        errors = list(self._validator.iter_errors(cv_data))
         
-        # Normalize data types (convert dates to strings, etc.)
-        normalized_data = self._normalize_data_for_validation(cv_data)
-        
-        try:
-            # Perform JSONSchema validation
-            validate(instance=normalized_data, schema=self.schema, format_checker=draft7_format_checker)
-            is_valid = True
-        except ValidationError as e:
-            # Collect all validation errors
-            validator = jsonschema.Draft7Validator(self.schema, format_checker=draft7_format_checker)
-            for error in validator.iter_errors(normalized_data):
-                messages.append(self._format_jsonschema_error(error))
-            is_valid = False
-        
-        # Find unknown fields and suggest corrections (use original data for field names)
+        # Find unknown fields and suggest corrections
         unknown_fields = self._find_unknown_fields(cv_data, self.schema)
-        for unknown_field in unknown_fields:
-            suggestion = self._suggest_field_name(unknown_field)
+        
+        result = ValidationResult(is_valid=not errors, unknown_fields=unknown_fields)
+        for error in errors:
+            result.add_message(self._format_jsonschema_error(error))
+        
+        suggestions = self._suggest_field_names(unknown_fields)
+        for unknown_field, suggestion in zip(unknown_fields, suggestions):
             suggestion_text = f"Did you mean '{suggestion}'?" if suggestion else None
             
-            messages.append(ValidationMessage(
+            result.add_message(ValidationMessage(
                 level=ValidationLevel.WARNING,
                 field_path=unknown_field,
                 message=f"Unknown field '{unknown_field}'",
                 suggestion=suggestion_text
             ))
         
-        return ValidationResult(
-            is_valid=is_valid,
-            messages=messages,
-            unknown_fields=unknown_fields
-        )
+        return result
+    
+    @staticmethod
+    def _data_cache_key(cv_data: Any) -> Optional[bytes]:
+        """Hash the canonical JSON form of CV data, or None if it cannot be serialized."""
+        date_seen = []
+        
+        def date_placeholder(obj: Any) -> int:
+            if isinstance(obj, date):
+                date_seen.append(obj)
+                return 0
+            raise TypeError
+        
+        # No stringifying fallback: turning e.g. bytes or sets into text would make
+        # them share a key with the equivalent plain string.
+        try:
+            canonical = orjson.dumps(
+                cv_data,
+                default=date_placeholder,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+            if date_seen:
+                # Dates hashed as 0 alone would collide with integers, and natively
+                # they match their quoted string; together the two forms are unique.
+                canonical += b"\0" + orjson.dumps(cv_data, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. non-string mapping keys, out-of-range integers or non-JSON types
+            return None
+        
+        # orjson writes NaN and +/-Infinity as null, the same as None. Such data has
+        # no one-to-one key, so it is not cached.
+        if b"null" in canonical and _contains_non_finite_float(cv_data):
+            return None
+        return hashlib.blake2b(canonical).digest()
     
     def validate_yaml_file(self, yaml_file: Path) -> ValidationResult:
         """Validate a YAML file and return results."""
         try:
-            with open(yaml_file, 'r', encoding='utf-8') as f:
-                cv_data = yaml.safe_load(f)
+            with open(yaml_file, 'rb') as f:
+                cv_data = yaml.load(f, Loader=SafeLoader)
         except FileNotFoundError:
             return ValidationResult(
                 is_valid=False,
@@ -227,10 +386,58 @@ class CVValidator:
                 unknown_fields=[]
             )
         
-        return self.validate_cv_data(cv_data)
+        # Reuse the outcome if identical data was already validated against this schema
+        key = self._data_cache_key(cv_data)
+        if key is None:
+            return self.validate_cv_data(cv_data)
+        
+        cached = self._result_cache.get(key)
+        if cached is None:
+            result = self.validate_cv_data(cv_data)
+            if len(self._result_cache) >= RESULT_CACHE_SIZE:
+                self._result_cache.pop(next(iter(self._result_cache)))
+            self._result_cache[key] = (
+                result.is_valid, tuple(result.messages), tuple(result.unknown_fields)
+            )
+            return result
+        
+        # Hand out a fresh result each time, so callers cannot alter the cached outcome
+        is_valid, messages, unknown_fields = cached
+        return ValidationResult(
+            is_valid=is_valid,
+            messages=list(messages),
+            unknown_fields=list(unknown_fields)
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_validator(schema_path: Path, mtime: float) -> CVValidator:
+    """Return a cached validator; the mtime key invalidates it when the schema is edited."""
+    return CVValidator(schema_path)
 
 
 def validate_cv_file(yaml_file: Path, schema_path: Optional[Path] = None) -> ValidationResult:
     """Convenience function to validate a CV file."""
-    validator = CVValidator(schema_path)
+    if schema_path is None:
+        schema_path = DEFAULT_SCHEMA_PATH
+    
+    try:
+        mtime = Path(schema_path).stat().st_mtime
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Schema file not found: {schema_path}")
+    
+    validator = _get_validator(Path(schema_path), mtime)
     return validator.validate_yaml_file(yaml_file)
+
+
+def validate_cv_files(yaml_files: List[Path], schema_path: Optional[Path] = None) -> List[ValidationResult]:
+    """Validate several CV files in parallel, returning results in input order."""
+    validate_one = functools.partial(validate_cv_file, schema_path=schema_path)
+    
+    # A process pool only pays off when there is more than one file
+    if len(yaml_files) <= 1:
+        return [validate_one(yaml_file) for yaml_file in yaml_files]
+    
+    # Each worker process builds its validator once (see _get_validator)
+    with ProcessPoolExecutor(max_workers=min(len(yaml_files), os.cpu_count() or 1)) as executor:
+        return list(executor.map(validate_one, yaml_files, chunksize=4))
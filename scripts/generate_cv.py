@@ -14,11 +14,12 @@ The script will:
 1. Load data from data/<basename>.yml
 2. Populate the Jinja2 template from template/cv_template.tex
 3. Generate a temporary .tex file in build/
-4. Compile it to PDF using pdflatex
+4. Compile it to PDF using latexmk (or pdflatex if latexmk is unavailable)
 5. Output the final PDF as build/<basename>.pdf
 """
 
 import argparse
+import functools
 import os
 import sys
 import subprocess
@@ -26,11 +27,21 @@ import tempfile
 import shutil
 import html
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 
 import yaml
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+# Prefer the libyaml-backed C loader when PyYAML was built with it.
+# YAML files are opened in binary mode so the parser decodes UTF-8 itself.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Directory (inside the build directory) holding compiled Jinja2 templates between runs
+JINJA_CACHE_DIRNAME = '.jinja_cache'
 
 # Import validation modules
 try:
@@ -45,8 +56,8 @@ except ImportError:
 def load_yaml_data(yaml_path: Path) -> Dict[str, Any]:
     """Load data from YAML file."""
     try:
-        with open(yaml_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        with open(yaml_path, 'rb') as f:
+            return yaml.load(f, Loader=SafeLoader)
     except FileNotFoundError:
         print(f"Error: YAML file not found: {yaml_path}")
         sys.exit(1)
@@ -116,7 +127,7 @@ def validate_and_load_yaml_data(yaml_path: Path, force: bool = False, dry_run: b
         print("\n" + "="*60)
         print("CV VALIDATION REPORT")
         print("="*60)
-        print(validation_result.format_detailed_report())
+        sys.stdout.writelines(validation_result.iter_report_lines())
         print("="*60)
 
         # Exit after validation in dry-run mode
@@ -140,8 +151,22 @@ def validate_and_load_yaml_data(yaml_path: Path, force: bool = False, dry_run: b
 
     # Escape LaTeX special characters after validation
     return escape_latex_recursive(data)
-def setup_jinja_environment(template_dir: Path) -> Environment:
-    """Set up Jinja2 environment for LaTeX templates."""
+
+
+@functools.lru_cache(maxsize=4)
+def setup_jinja_environment(template_dir: Path, bytecode_cache_dir: Optional[Path] = None) -> Environment:
+    """Set up Jinja2 environment for LaTeX templates.
+
+    Environments are cached per template directory so that Jinja2's own
+    compiled-template cache is reused across render calls. When
+    bytecode_cache_dir is given, compiled templates are also persisted there
+    so later runs skip parsing and compiling the template.
+    """
+    bytecode_cache = None
+    if bytecode_cache_dir is not None:
+        bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+
     # Configure Jinja2 for LaTeX (avoid conflicts with LaTeX syntax)
     # Note: autoescape is disabled because we manually escape LaTeX special characters
     env = Environment(
@@ -154,58 +179,40 @@ def setup_jinja_environment(template_dir: Path) -> Environment:
         comment_end_string='#}',
         autoescape=False,  # Disabled - we manually escape LaTeX characters
         trim_blocks=True,
-        lstrip_blocks=True
+        lstrip_blocks=True,
+        auto_reload=False,  # Templates do not change during a single run
+        cache_size=400,
+        bytecode_cache=bytecode_cache
     )
     return env
 
 
-def render_template(template_path: Path, data: Dict[str, Any], anonymous: bool = False) -> str:
-    """Render the LaTeX template with the provided data."""
+def render_template_to_file(template_path: Path, data: Dict[str, Any], output_path: Path,
+                            anonymous: bool = False) -> None:
+    """Render the LaTeX template straight into output_path, streaming it in chunks."""
     try:
-        env = setup_jinja_environment(template_path.parent)
+        env = setup_jinja_environment(template_path.parent, output_path.parent / JINJA_CACHE_DIRNAME)
         template = env.get_template(template_path.name)
 
         # Add the anonymous flag to template context
         template_context = data.copy()
         template_context['anonymous'] = anonymous
 
-        return template.render(**template_context)
+        template.stream(**template_context).dump(str(output_path), encoding='utf-8')
     except Exception as e:
         print(f"Error rendering template: {e}")
         sys.exit(1)
 
 
 def compile_latex_to_pdf(tex_file: Path, output_dir: Path) -> bool:
-    """Compile LaTeX file to PDF using pdflatex (runs twice to resolve references)."""
+    """Compile LaTeX file to PDF using latexmk (runs only as many passes as needed)."""
     try:
-        # Try pdflatex first - run twice to resolve page references
-        pdflatex_success = True
-        for pass_num in range(1, 3):
-            result = subprocess.run([
-                'pdflatex',
-                '-interaction=nonstopmode',
-                '-output-directory', str(output_dir),
-                str(tex_file)
-            ], 
-            capture_output=True, 
-            text=True,
-            cwd=output_dir
-            )
-
-            if result.returncode != 0:
-                pdflatex_success = False
-                break
-
-        if pdflatex_success:
-            print("PDF compilation successful!")
-            return True
-
-        # If pdflatex failed, try latexmk as fallback
-        print("pdflatex compilation failed. Trying latexmk...")
+        # latexmk reruns pdflatex only until references are resolved
         result = subprocess.run([
             'latexmk',
             '-pdf',
             '-interaction=nonstopmode',
+            '-halt-on-error',
             '-output-directory=' + str(output_dir),
             str(tex_file)
         ], 
@@ -223,6 +230,33 @@ def compile_latex_to_pdf(tex_file: Path, output_dir: Path) -> bool:
             print(f"stderr: {result.stderr}")
             return False
 
+    except FileNotFoundError:
+        pass
+
+    # If latexmk is not installed, fall back to pdflatex - run twice to resolve page references
+    print("latexmk not found. Trying pdflatex...")
+    try:
+        for pass_num in range(1, 3):
+            result = subprocess.run([
+                'pdflatex',
+                '-interaction=nonstopmode',
+                '-output-directory', str(output_dir),
+                str(tex_file)
+            ], 
+            capture_output=True, 
+            text=True,
+            cwd=output_dir
+            )
+
+            if result.returncode != 0:
+                print(f"LaTeX compilation failed:")
+                print(f"stdout: {result.stdout}")
+                print(f"stderr: {result.stderr}")
+                return False
+
+        print("PDF compilation successful!")
+        return True
+
     except FileNotFoundError:
         print("Error: Neither pdflatex nor latexmk found. Please install a LaTeX distribution.")
         return False
@@ -325,11 +359,8 @@ def main():
         print("🔒 Generating anonymous CV (personal identifying information will be hidden)")
 
     print(f"Rendering template: {template_file}")
-    rendered_tex = render_template(template_file, data, anonymous)
-
     print(f"Writing LaTeX file: {tex_output}")
-    with open(tex_output, 'w', encoding='utf-8') as f:
-        f.write(rendered_tex)
+    render_template_to_file(template_file, data, tex_output, anonymous)
 
     print(f"Compiling to PDF...")
     if compile_latex_to_pdf(tex_output, build_dir):
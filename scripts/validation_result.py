@@ -5,113 +5,168 @@ Validation Result Classes
 Data structures for storing CV validation results, errors, warnings, and suggestions.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
-from enum import Enum
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+from enum import IntEnum
 
 
-class ValidationLevel(Enum):
+class ValidationLevel(IntEnum):
     """Severity levels for validation messages."""
-    ERROR = "error"
-    WARNING = "warning"
-    INFO = "info"
+    ERROR = 0
+    WARNING = 1
+    INFO = 2
 
 
-@dataclass
+# Display icon for each validation level, indexed by level
+_LEVEL_ICON = ("❌", "⚠️", "ℹ️")
+
+# Canonical instances of suggestion texts, shared by all messages
+_SUGGESTION_POOL: Dict[str, str] = {}
+
+# Report line for an unknown field, pre-bound so it can be mapped in C
+_UNK_FMT = "  ❓ Unknown field: '{}'\n".format
+
+
+def _plural(count: int, word: str) -> str:
+    """Format a count with a naively pluralized word (e.g. '2 errors')."""
+    return f"{count} {word}{'s' if count != 1 else ''}"
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationMessage:
     """Individual validation message with details."""
     level: ValidationLevel
     field_path: str
     message: str
     suggestion: Optional[str] = None
+    _rendered: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Share repeated field paths and suggestion texts across messages."""
+        object.__setattr__(self, 'field_path', sys.intern(self.field_path))
+        if self.suggestion is not None:
+            object.__setattr__(
+                self, 'suggestion', _SUGGESTION_POOL.setdefault(self.suggestion, self.suggestion)
+            )
     
     def __str__(self) -> str:
-        """Format validation message for display."""
-        icon = {
-            ValidationLevel.ERROR: "❌",
-            ValidationLevel.WARNING: "⚠️",
-            ValidationLevel.INFO: "ℹ️"
-        }[self.level]
+        """Format validation message for display (rendered once, then cached)."""
+        if self._rendered is not None:
+            return self._rendered
         
-        result = f"{icon} {self.level.value.upper()}: {self.message}"
-        if self.field_path:
-            result = f"{result} (at {self.field_path})"
-        if self.suggestion:
-            result = f"{result}\n   💡 Suggestion: {self.suggestion}"
+        location = f" (at {self.field_path})" if self.field_path else ""
+        suggestion = f"\n   💡 Suggestion: {self.suggestion}" if self.suggestion else ""
+        result = f"{_LEVEL_ICON[self.level]} {self.level.name}: {self.message}{location}{suggestion}"
+        object.__setattr__(self, '_rendered', result)
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
-    """Complete validation result with all messages and status."""
+    """Complete validation result with all messages and status.
+    
+    Pass initial messages to the constructor and add later ones with
+    add_message(); appending to messages directly bypasses the per-level
+    buckets behind errors, warnings and infos.
+    """
     is_valid: bool
-    messages: List[ValidationMessage]
-    unknown_fields: List[str]
+    messages: List[ValidationMessage] = field(default_factory=list)
+    unknown_fields: List[str] = field(default_factory=list)
+    _errors: List[ValidationMessage] = field(init=False, repr=False, compare=False)
+    _warnings: List[ValidationMessage] = field(init=False, repr=False, compare=False)
+    _infos: List[ValidationMessage] = field(init=False, repr=False, compare=False)
+    _bucket_append: Dict[ValidationLevel, Callable[[ValidationMessage], None]] = field(
+        init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        """Bucket messages by level, so filtering never rescans the message list."""
+        self._errors = []
+        self._warnings = []
+        self._infos = []
+        self._bucket_append = {
+            ValidationLevel.ERROR: self._errors.append,
+            ValidationLevel.WARNING: self._warnings.append,
+            ValidationLevel.INFO: self._infos.append
+        }
+        for msg in self.messages:
+            self._bucket_append[msg.level](msg)
+    
+    def add_message(self, msg: ValidationMessage) -> None:
+        """Add a message, keeping the per-level buckets up to date."""
+        self.messages.append(msg)
+        self._bucket_append[msg.level](msg)
     
     @property
     def errors(self) -> List[ValidationMessage]:
         """Get only error messages."""
-        return [msg for msg in self.messages if msg.level == ValidationLevel.ERROR]
+        return self._errors
     
     @property
     def warnings(self) -> List[ValidationMessage]:
         """Get only warning messages."""
-        return [msg for msg in self.messages if msg.level == ValidationLevel.WARNING]
+        return self._warnings
+    
+    @property
+    def infos(self) -> List[ValidationMessage]:
+        """Get only informational messages."""
+        return self._infos
     
     @property
     def has_errors(self) -> bool:
         """Check if there are any errors."""
-        return len(self.errors) > 0
+        return bool(self._errors)
     
     @property
     def has_warnings(self) -> bool:
         """Check if there are any warnings."""
-        return len(self.warnings) > 0
+        return bool(self._warnings)
     
     def format_summary(self) -> str:
         """Format a summary of validation results."""
-        if self.is_valid and not self.has_warnings:
+        errors = self._errors
+        warnings = self._warnings
+        unknown_fields = self.unknown_fields
+        
+        if self.is_valid and not warnings:
             return "✅ CV validation passed successfully!"
         
-        summary = []
+        if not (errors or warnings or unknown_fields):
+            return "✅ CV validation completed"
         
-        if self.has_errors:
-            error_count = len(self.errors)
-            summary.append(f"❌ {error_count} error{'s' if error_count != 1 else ''}")
+        counts = (
+            ("❌", len(errors), "error"),
+            ("⚠️", len(warnings), "warning"),
+            ("❓", len(unknown_fields), "unknown field"),
+        )
+        return " | ".join(
+            f"{icon} {_plural(count, word)}" for icon, count, word in counts if count
+        )
+    
+    def iter_report_lines(self) -> Iterator[str]:
+        """Yield the detailed report line by line, each ending with a newline."""
+        errors = self._errors
+        warnings = self._warnings
+        unknown_fields = self.unknown_fields
         
-        if self.has_warnings:
-            warning_count = len(self.warnings)
-            summary.append(f"⚠️ {warning_count} warning{'s' if warning_count != 1 else ''}")
+        yield f"{self.format_summary()}\n"
         
-        if self.unknown_fields:
-            unknown_count = len(self.unknown_fields)
-            summary.append(f"❓ {unknown_count} unknown field{'s' if unknown_count != 1 else ''}")
+        if errors:
+            yield "\n"
+            yield "ERRORS:\n"
+            yield from (f"  {text}\n" for text in map(str, errors))
         
-        if not summary:
-            return "✅ CV validation completed"
+        if warnings:
+            yield "\n"
+            yield "WARNINGS:\n"
+            yield from (f"  {text}\n" for text in map(str, warnings))
         
-        return " | ".join(summary)
+        if unknown_fields:
+            yield "\n"
+            yield "UNKNOWN FIELDS:\n"
+            yield from map(_UNK_FMT, unknown_fields)
     
     def format_detailed_report(self) -> str:
         """Format detailed validation report."""
-        lines = [self.format_summary(), ""]
-        
-        if self.has_errors:
-            lines.append("ERRORS:")
-            for error in self.errors:
-                lines.append(f"  {error}")
-            lines.append("")
-        
-        if self.has_warnings:
-            lines.append("WARNINGS:")
-            for warning in self.warnings:
-                lines.append(f"  {warning}")
-            lines.append("")
-        
-        if self.unknown_fields:
-            lines.append("UNKNOWN FIELDS:")
-            for field in self.unknown_fields:
-                lines.append(f"  ❓ Unknown field: '{field}'")
-            lines.append("")
-        
-        return "\n".join(lines).strip()
+        return "".join(self.iter_report_lines()).rstrip()